@@ -1,15 +1,23 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass
-from typing import Callable, Any
+from typing import Any, Iterator
 
-@dataclass
+FREEZE_CANDIDATES = 8 # number of free slots `HashTrie.freeze` tries for a state before appending it at the end
+
+@dataclass(slots=True)
 class AbstractNode(ABC):
     """
     Abstract class for nodes in a trie.
+
+    The tries create their nodes with positional arguments,
+    as passing keywords to the generated `__init__` almost doubles the cost of creating a node.
     """
 
-    char: str
+    label: str # the characters on the edge from the parent to this node, never empty
     children: Any
 
     @abstractmethod
@@ -19,7 +27,7 @@ class AbstractNode(ABC):
         """
         pass
 
-@dataclass
+@dataclass(slots=True)
 class AbstractTrie(ABC):
     """
     Abstract class for trie data structures.
@@ -28,263 +36,692 @@ class AbstractTrie(ABC):
     children: Any
 
     @abstractmethod
-    def _go_through_trie(self,
-        word: str,
-        if_found: Callable[[AbstractNode, AbstractNode], None],
-        if_not_found: Callable[[AbstractNode, str], bool],
-        when_completed: Callable[[], bool]
-    ) -> bool:
-        """
-        Go through the trie structure with the given word and call the appropriate
-        functions when a node for a character is found, not found, or when the traversal
-        is completed. Returns a boolean value representing the success of the operation.
-        """
-        pass
-
     def contains(self, word: str) -> bool:
         """
         Checks whether the trie contains the given word.
 
         Returns `True` if the word is found, `False` otherwise.
         """
-        return self._go_through_trie(
-            word,
-            if_found=lambda parent, child: None, # do nothing when a node is found
-            if_not_found=lambda parent, rest_word: False, # if a node is not found, the word is not contained in the trie
-            when_completed=lambda: True # the word is contained in trie if traversal is completed
-        )
+        pass
 
     @abstractmethod
-    def _delete_child_from_parent(parent_children, child: AbstractNode) -> None:
+    def contains_many(self, words: list[str]) -> list[bool]:
         """
-        Given a list/array/dictionary of children, delete the given child.
+        Checks for each of the given words whether the trie contains it.
+
+        Implementations can share work between the words of the batch: e.g. the words can be looked up
+        in sorted order, so that each lookup continues from the deepest node on the path of the previous word
+        that is still a prefix of the current one.
+
+        Returns a list with the result of `contains` for each word, in the order of `words`.
         """
         pass
 
+    @abstractmethod
     def delete(self, word: str) -> bool:
         """
         Deletes the given word from the trie.
 
-        Returns `True` if the word was deleted, `False` otherwise.
-        """
-        marked_parent = None
-        child_to_delete = None
+        A node is only deleted, if it has at most one child. If it has more, this means that
+        multiple words share this prefix. Thus, the topmost node below the last branching
+        node of the word's path is removed from its parent.
 
-        # A node is only (potentially deleted), if it has at most one child.
-        # If it has more, this means that multiple words have this same prefix.
-        def mark_parent(parent, child):
-            nonlocal marked_parent, child_to_delete
-            if not child.has_max_children(1): # reset mark, if the child has more than one child
-                marked_parent = None
-                child_to_delete = None
-            elif marked_parent == None: # set mark, if it has at most one child
-                marked_parent = parent
-                child_to_delete = child
-
-        # Only if the word is contained in the trie, it can be deleted.
-        # This is ensured, by checking whether the traversal was completed.
-        def delete_child_from_marked():
-            nonlocal marked_parent, child_to_delete
-            self._delete_child_from_parent(marked_parent.children, child_to_delete)
-            return True
-        
-        return self._go_through_trie(
-            word,
-            if_found=lambda parent, child: mark_parent(parent, child),
-            if_not_found=lambda parent, rest_word: False,
-            when_completed=lambda: delete_child_from_marked()
-        )
-    
-    @abstractmethod
-    def _add_empty_child(self, parent_children, character: str):
-        """
-        Create a new child node with the given character and add it to the parent's children.
+        Returns `True` if the word was deleted, `False` otherwise.
         """
         pass
 
+    @abstractmethod
     def insert(self, word: str) -> bool:
         """
         Inserts the given word into the trie.
 
         Returns `True` if the word was inserted, `False` if it already is contained.
         """
+        pass
 
-        # Construct a new subtrie for the rest of the word and add it to the parent's children.
-        def insert_child(parent, rest_word):
-            current_child = parent
-            for character in rest_word:
-                current_child = self._add_empty_child(current_child.children, character)
-            return True
-
-        return self._go_through_trie(
-            word,
-            if_found=lambda parent, child: None, # do nothing when a node is found
-            if_not_found=lambda parent, rest_word: insert_child(parent, rest_word),
-            when_completed=lambda: False # if the traversal is completed, the word is already contained
-        )
 
 
+def _label_partitions(words: list[str], lo: int, hi: int, depth: int) -> Iterator[tuple[str, str, int, int]]:
+    """
+    Partitions the sorted words in `words[lo:hi]`, which share their first `depth` characters,
+    by their character at the current depth (by binary search). Used by the bulk builders of the compressed tries.
 
-@dataclass
+    Yields for each partition, in sorted order, its character, the label of its node
+    and the range `words[start:end]` that still has to be built below that node, which is empty for a leaf.
+    The label of a partition's node is the common prefix of its first and last word.
+    """
+    while lo < hi and len(words[lo]) == depth: lo += 1 # words ending here need no further nodes
+    while lo < hi:
+        word = words[lo]
+        character = word[depth]
+        # the partition of this character ends before the first word with a greater character
+        if character == '\U0010ffff': end = hi # there is no greater character, all remaining words share it
+        else: end = bisect_left(words, word[:depth] + chr(ord(character)+1), lo, hi)
+        start = lo
+        lo = end
+        # Words that are a prefix of the partition's last word do not branch, they are skipped.
+        last = words[end-1]
+        while start < end - 1 and last.startswith(words[start]): start += 1
+        if start == end - 1: # a single word only needs a leaf for its rest
+            yield character, last[depth:], end, end
+        else:
+            # The sorted words share the common prefix of the first and the last one.
+            first = words[start]
+            k = depth + 1
+            while first[k] == last[k]: k += 1 # the first word is no prefix of the last, so they differ somewhere
+            yield character, first[depth:k], start, end
+
+
+
+@dataclass(slots=True)
 class VarSizeNode(AbstractNode):
     """
     Class for nodes in a variable size trie.
     """
 
     children: list[VarSizeNode]
+    child_chars: list[str] # sorted first characters of the children's labels, `child_chars[i]` belongs to `children[i]`
 
     def has_max_children(self, max_children):
         if self.children is None: return True
         # The list contains exactly the number of children.
         return len(self.children) <= max_children
 
-@dataclass
+@dataclass(slots=True)
 class VarSizeTrie(AbstractTrie):
     """
     Class for variable size trie data structures.
 
-    For each node, its character is stored as a string and the children are stored in a list.
+    For each node, the label of the edge from its parent is stored as a string and the children are stored in a list.
+    Chains of nodes with a single child are compressed into one node (Patricia trie),
+    so that every node but the root has either no or at least two children.
+    The first characters of the children's labels are additionally kept in a parallel sorted list,
+    so that the right child is found by binary search instead of enumerating all children.
     """
 
     children: list[VarSizeNode]
+    child_chars: list[str]
 
-    def _go_through_trie(self, word: str, if_found, if_not_found, when_completed) -> bool:
-        parent = self # parent is initialized with a VarSizeTrie -> later it will be a VarSizeNode
-        for i, character in enumerate(word):
-            found = False
-            # one has to enumerate through all children to find the right one
-            for child in parent.children:
-                if character == child.char:
-                    if_found(parent, child)
-                    parent = child # child is a VarSizeNode!
-                    found = True
+    def contains(self, word: str) -> bool:
+        node = self # node is initialized with a VarSizeTrie -> later it will be a VarSizeNode
+        i = 0
+        n = len(word)
+        while i < n:
+            character = word[i]
+            child_chars = node.child_chars
+            j = bisect_left(child_chars, character)
+            if j == len(child_chars) or child_chars[j] != character: return False
+            node = node.children[j] # child is a VarSizeNode!
+            label = node.label
+            # compare the whole label at once: No need to go through the chain character by character!
+            if not word.startswith(label, i): return label.startswith(word[i:]) # the word may end inside the label
+            i += len(label)
+        return True
+
+    def contains_many(self, words: list[str]) -> list[bool]:
+        results = [False] * len(words)
+        stack = [(self, '')] # nodes on the path of the previous word, with the characters leading to them
+        for w in sorted(range(len(words)), key=words.__getitem__):
+            word = words[w]
+            while not word.startswith(stack[-1][1]): stack.pop() # the root's empty prefix always matches
+            node, prefix = stack[-1]
+            i = len(prefix)
+            n = len(word)
+            while i < n:
+                character = word[i]
+                child_chars = node.child_chars
+                j = bisect_left(child_chars, character)
+                if j == len(child_chars) or child_chars[j] != character: break
+                node = node.children[j]
+                label = node.label
+                if not word.startswith(label, i):
+                    results[w] = label.startswith(word[i:])
                     break
-            if not found: return if_not_found(parent, word[i:])
-        return when_completed()
+                i += len(label)
+                stack.append((node, word[:i]))
+            else: results[w] = True
+        return results
 
-    def _delete_child_from_parent(self, parent_children, child):
-        parent_children.remove(child) # default list method does the trick
+    def delete(self, word: str) -> bool:
+        marked_node = None
+        marked_idx = None
+        node = self
+        i = 0
+        n = len(word)
+        while i < n:
+            character = word[i]
+            child_chars = node.child_chars
+            j = bisect_left(child_chars, character)
+            if j == len(child_chars) or child_chars[j] != character: return False # only a contained word can be deleted
+            child = node.children[j]
+            label = child.label
+            if not word.startswith(label, i):
+                if not label.startswith(word[i:]): return False
+                # The word ends inside the label, where every (compressed) node has exactly one child.
+                if marked_node is None:
+                    marked_node = node
+                    marked_idx = j
+                break
+            if not child.has_max_children(1): # reset mark, if the child has more than one child
+                marked_node = None
+            elif marked_node is None: # set mark, if it has at most one child
+                marked_node = node
+                marked_idx = j
+            i += len(label)
+            node = child
+        if marked_node is None: return False # every node of the path is still needed
+        del marked_node.child_chars[marked_idx]
+        del marked_node.children[marked_idx]
+        if marked_node is not self and marked_node.has_max_children(1):
+            # A node with a single child is merged with it to keep the trie compressed.
+            child = marked_node.children[0]
+            marked_node.label += child.label
+            marked_node.children = child.children
+            marked_node.child_chars = child.child_chars
+        return True
 
-    def _add_empty_child(self, parent_children, character):
-        # new children list can be initialized with an empty list
-        new_child = VarSizeNode(char=character, children=[])
-        parent_children.append(new_child)
-        return new_child
+    def insert(self, word: str) -> bool:
+        node = self
+        i = 0
+        n = len(word)
+        while i < n:
+            character = word[i]
+            child_chars = node.child_chars
+            j = bisect_left(child_chars, character)
+            if j == len(child_chars) or child_chars[j] != character:
+                if node is not self and not node.children:
+                    # A leaf is extended instead of getting a single child.
+                    node.label += word[i:]
+                else:
+                    # The rest of the word becomes a single new leaf. Only it has to be sorted in.
+                    child_chars.insert(j, character)
+                    node.children.insert(j, VarSizeNode(word[i:], [], []))
+                return True
+            child = node.children[j]
+            label = child.label
+            if not word.startswith(label, i):
+                # Find the first character where the word and the label differ.
+                k = 1
+                end = min(len(label), n - i)
+                while k < end and label[k] == word[i+k]: k += 1
+                if k == n - i: return False # the word ends inside the label, so it is already contained
+                # Split the label: The upper part gets the rest of the old label and the rest of the word as children.
+                child.label = label[k:]
+                new_child = VarSizeNode(word[i+k:], [], [])
+                if label[k] < word[i+k]: split = VarSizeNode(label[:k], [child, new_child], [label[k], word[i+k]])
+                else: split = VarSizeNode(label[:k], [new_child, child], [word[i+k], label[k]])
+                node.children[j] = split
+                return True
+            i += len(label)
+            node = child
+        return False # if the traversal is completed, the word is already contained
 
     @staticmethod
-    def create_trie(words: list[str]) -> VarSizeTrie:
-        trie = VarSizeTrie(children=[])
+    def create_trie(words: list[str], is_sorted: bool = False) -> VarSizeTrie:
+        trie = VarSizeTrie(children=[], child_chars=[])
+        if not is_sorted: words = sorted(words) # consecutive words share prefixes, so their nodes are still in cache
         for word in words: trie.insert(word)
         return trie
 
+    @staticmethod
+    def create_trie_bulk(words: list[str]) -> VarSizeTrie:
+        """
+        Creates the trie without inserting the words one by one.
 
+        The sorted words are partitioned by their character at the current depth (see `_label_partitions`)
+        and each partition is built into its own subtrie. The partitions still to be built are kept on a stack.
+        This way every node is created exactly once and all children lists end up sorted.
+        """
+        words = sorted(words)
+        trie = VarSizeTrie(children=[], child_chars=[])
+        stack: list[tuple[VarSizeTrie | VarSizeNode, int, int, int]] = [(trie, 0, len(words), 0)]
+        while stack:
+            node, lo, hi, depth = stack.pop()
+            for character, label, start, end in _label_partitions(words, lo, hi, depth):
+                child = VarSizeNode(label, [], [])
+                if start < end: stack.append((child, start, end, depth + len(label)))
+                node.child_chars.append(character)
+                node.children.append(child)
+        return trie
 
-@dataclass
-class FixedSizeNode(AbstractNode):
-    """
-    Class for nodes in a variable size trie.
-    """
-
-    children: list[FixedSizeNode]
 
-    def has_max_children(self, max_children):
-        if self.children is None: return True
-        # The list contains more elements than the number of children.
-        # Thus one has to filter out the None elements.
-        return sum(1 for _ in filter(None.__ne__, self.children)) <= max_children
 
-@dataclass
+@dataclass(slots=True)
 class FixedSizeTrie(AbstractTrie):
     """
     Class for fixed size trie data structures.
 
-    For each node, the children are stored in a fixed size list and the character to index mapping is stored in a list.
+    Instead of a node object per character, all nodes share one flat table of child indices:
+    the children of node `n` occupy the slots `n * len(alphabet)` to `(n+1) * len(alphabet)`,
+    and the slot of a character is given by the character to index mapping.
+    The root is node 0, which can never be a child. Thus 0 marks an empty slot.
     """
 
-    children: list[FixedSizeNode]
-    char_to_idx: list[int] # necessary for O(1) access! Converts a character to an index in the children list.
+    children: array # flat int32 table of child node indices, 0 meaning empty
+    child_masks: list[int] # per node, bit `i` is set if the slot `i` of its row holds a child
+    char_to_idx: bytes # necessary for O(1) access! Translates a Latin-1 byte to an index in a node's row, 0xFF if not in the alphabet.
     alphabet: str
+    empty_row: array # a row without children, copied for every new node
+    free_rows: list[int] # nodes whose rows were emptied by `delete`, reused before the table grows
 
-    def _go_through_trie(self, word: str, if_found, if_not_found, when_completed) -> bool:
-        parent = self
-        for i, character in enumerate(word):
+    def _add_child(self, node: int, idx: int) -> int:
+        """
+        Create a new child node for the character index `idx` by appending an empty row,
+        add it to the row of `node`, and return the new child.
+        """
+        alphabet_size = len(self.alphabet)
+        if self.free_rows: child = self.free_rows.pop() # the row is already empty
+        else:
+            child = len(self.child_masks)
+            self.children.extend(self.empty_row) # a plain memory copy, no temporary row has to be built
+            self.child_masks.append(0)
+        self.children[node*alphabet_size + idx] = child
+        self.child_masks[node] |= 1 << idx
+        return child
+
+    def _free_subtrie(self, node: int) -> None:
+        """
+        Empty the rows of the given node and all its descendants and hand them over to `free_rows`.
+        """
+        children = self.children
+        child_masks = self.child_masks
+        alphabet_size = len(self.alphabet)
+        empty_row = self.empty_row
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            mask = child_masks[node]
+            while mask: # visit the children by the set bits of the mask
+                idx = (mask & -mask).bit_length() - 1
+                stack.append(children[node*alphabet_size + idx])
+                mask &= mask - 1
+            children[node*alphabet_size:(node+1)*alphabet_size] = empty_row
+            child_masks[node] = 0
+            self.free_rows.append(node)
+
+    def contains(self, word: str) -> bool:
+        children = self.children
+        alphabet_size = len(self.alphabet)
+        # Translate the whole word to indices at once: No need to look up each character!
+        try: indices = word.encode('latin-1').translate(self.char_to_idx)
+        except UnicodeEncodeError: return False # the character is not in the alphabet
+        if 0xFF in indices: return False # the character is not in the alphabet
+        node = 0
+        for idx in indices:
             # get the child by the index: No need to enumerate through all children!
-            child = parent.children[self.char_to_idx[ord(character)]]
-            if child: # if the child is not None
-                if_found(parent, child)
-                parent = child
-            else: return if_not_found(parent, word[i:])
-        return when_completed()
-
-    def _delete_child_from_parent(self, parent_children, child):
-        # To delete a child, one simply has to set it to None.
-        parent_children[self.char_to_idx[ord(child.char)]] = None
-
-    def _add_empty_child(self, parent_children, character):
-        new_children = [None] * len(self.alphabet) # init new children array with many None elements
-        new_child = FixedSizeNode(char=character, children=new_children)
-        parent_children[self.char_to_idx[ord(character)]] = new_child
-        return new_child
+            node = children[node*alphabet_size + idx]
+            if node == 0: return False
+        return True
+
+    def contains_many(self, words: list[str]) -> list[bool]:
+        # Unlike for the compressed tries, resuming from the previous word's path does not pay off here,
+        # as it would need a stack entry per character. Instead, the whole batch runs in one integer loop.
+        char_to_idx = self.char_to_idx
+        children = self.children
+        alphabet_size = len(self.alphabet)
+        results = [False] * len(words)
+        for w, word in enumerate(words):
+            try: indices = word.encode('latin-1').translate(char_to_idx)
+            except UnicodeEncodeError: continue # the character is not in the alphabet
+            if 0xFF in indices: continue # the character is not in the alphabet
+            node = 0
+            for idx in indices:
+                node = children[node*alphabet_size + idx]
+                if node == 0: break
+            else: results[w] = True
+        return results
+
+    def delete(self, word: str) -> bool:
+        children = self.children
+        child_masks = self.child_masks
+        alphabet_size = len(self.alphabet)
+        try: indices = word.encode('latin-1').translate(self.char_to_idx)
+        except UnicodeEncodeError: return False # the character is not in the alphabet
+        if 0xFF in indices: return False # the character is not in the alphabet
+        marked_node = None
+        marked_idx = None
+        node = 0
+        for idx in indices:
+            child = children[node*alphabet_size + idx]
+            if child == 0: return False # only a contained word can be deleted
+            # The row contains more slots than the number of children, but the mask has exactly one bit per child.
+            if child_masks[child].bit_count() > 1: # reset mark, if the child has more than one child
+                marked_node = None
+            elif marked_node is None: # set mark, if it has at most one child
+                marked_node = node
+                marked_idx = idx
+            node = child
+        if marked_node is None: return False # every node of the path is still needed
+        # To delete a child, one simply has to empty its slot and clear its bit.
+        # Its rows are emptied as well, so that new nodes can reuse them instead of growing the table.
+        self._free_subtrie(children[marked_node*alphabet_size + marked_idx])
+        children[marked_node*alphabet_size + marked_idx] = 0
+        child_masks[marked_node] &= ~(1 << marked_idx)
+        return True
+
+    def insert(self, word: str) -> bool:
+        children = self.children
+        alphabet_size = len(self.alphabet)
+        # The word is checked before the traversal, so that an invalid word does not leave a partial path behind.
+        try: indices = word.encode('latin-1').translate(self.char_to_idx)
+        except UnicodeEncodeError: indices = b'\xff'
+        if 0xFF in indices: raise ValueError(f"Word {word!r} contains characters that are not in the alphabet")
+        node = 0
+        for i, idx in enumerate(indices):
+            child = children[node*alphabet_size + idx]
+            if child == 0:
+                # Construct a new subtrie for the rest of the word.
+                for idx in indices[i:]:
+                    node = self._add_child(node, idx)
+                return True
+            node = child
+        return False # if the traversal is completed, the word is already contained
 
     @staticmethod
-    def create_trie(alphabet: str, words: list[str]) -> FixedSizeTrie:
-        # Find the highest index in the alphabet to determine the size of the children list.
-        highest_index = max([ord(char) for char in alphabet.strip('\x00')])
-        char_to_idx: list[int] = [None] * (highest_index+1)
-        children: list[FixedSizeNode] = [None] * len(alphabet)
+    def create_trie(alphabet: str, words: list[str], is_sorted: bool = False) -> FixedSizeTrie:
+        # The mapping is a translation table for `bytes.translate` (0xFF marks characters outside the alphabet),
+        # so the words are encoded to Latin-1 and translated to indices in C. It stays small and cache resident.
+        if len(alphabet) >= 0xFF: raise ValueError("Alphabet must contain less than 255 characters")
+        if max(alphabet) > '\xff': raise ValueError("Alphabet must only contain Latin-1 characters")
+        char_to_idx = bytearray(b'\xff') * 256
+        empty_row = array('i', [0]) * len(alphabet)
         for i, char in enumerate(alphabet):
             char_to_idx[ord(char)] = i # map the character to the index
-        trie = FixedSizeTrie(char_to_idx=char_to_idx, alphabet=alphabet, children=children)
+        trie = FixedSizeTrie(char_to_idx=bytes(char_to_idx), alphabet=alphabet, empty_row=empty_row,
+                             children=array('i', empty_row), child_masks=[0], free_rows=[]) # the root starts with an empty row
+        if not is_sorted: words = sorted(words) # consecutive words share prefixes, so their nodes are still in cache
         for word in words: trie.insert(word)
         return trie
 
+    @staticmethod
+    def create_trie_bulk(alphabet: str, words: list[str]) -> FixedSizeTrie:
+        """
+        Creates the trie without inserting the words one by one.
+
+        The words are translated to their indices and sorted. Then they are partitioned (by binary search)
+        by their index at the current depth and each partition is built into its own subtrie.
+        The partitions still to be built are kept on a stack.
+        This way every row is appended exactly once and no traversal from the root is necessary.
+        """
+        trie = FixedSizeTrie.create_trie(alphabet, [])
+        try: words = sorted(word.encode('latin-1').translate(trie.char_to_idx) for word in words)
+        except UnicodeEncodeError: raise ValueError("Words contain characters that are not in the alphabet")
+        if any(0xFF in word for word in words): raise ValueError("Words contain characters that are not in the alphabet")
+
+        stack = [(0, 0, len(words), 0)]
+        while stack:
+            node, lo, hi, depth = stack.pop()
+            # All words in `words[lo:hi]` share their first `depth` indices.
+            while lo < hi and len(words[lo]) == depth: lo += 1 # words ending here need no further rows
+            while lo < hi:
+                word = words[lo]
+                idx = word[depth]
+                # the partition of this index ends before the first word with a greater index
+                end = bisect_left(words, word[:depth] + bytes((idx+1,)), lo, hi)
+                child = trie._add_child(node, idx)
+                if end - lo == 1: # a single word only needs a chain of rows for its rest
+                    for idx in word[depth+1:]:
+                        child = trie._add_child(child, idx)
+                else: stack.append((child, lo, end, depth+1))
+                lo = end
+        return trie
 
 
-@dataclass
+
+@dataclass(slots=True)
 class HashNode(AbstractNode):
     """
     Class for nodes in a variable size trie.
     """
 
-    children: dict[str, HashNode]
+    children: dict[str, HashNode] # keyed by the first character of the child's label
 
-    def has_max_children(self, max_children):
+    def has_max_children(self, max_children: int) -> bool:
         if self.children is None: return True
         # The dictionary's keys contain exactly the number of children.
-        return len(self.children.keys()) <= max_children
+        return len(self.children) <= max_children
 
-@dataclass
+@dataclass(slots=True)
 class HashTrie(AbstractTrie):
     """
     Class for hash trie data structures.
 
     For each node, the children are stored in a dictionary.
+    Chains of nodes with a single child are compressed into one node (Patricia trie),
+    so that every node but the root has either no or at least two children.
     """
 
     children: dict[str, HashNode]
 
-    def _go_through_trie(self, word: str, if_found, if_not_found, when_completed) -> bool:
-        parent = self
-        for i, character in enumerate(word):
+    def contains(self, word: str) -> bool:
+        children = self.children
+        i = 0
+        n = len(word)
+        while i < n:
             # get the child by the character: No need to enumerate through all children!
-            if character in parent.children:
-                child = parent.children[character]
-                if_found(parent, child)
-                parent = child
-            else: return if_not_found(parent, word[i:])
-        return when_completed()
-    
-    def _delete_child_from_parent(self, parent_children, child):
-        parent_children.pop(child.char) # default dictionary method does the trick
-
-    def _add_empty_child(self, parent_children, character):
-        # new children dictionary can be initialized with an empty dictionary
-        new_child = HashNode(char=character, children={})
-        parent_children[character] = new_child
-        return new_child
+            child = children.get(word[i])
+            if child is None: return False
+            label = child.label
+            if not word.startswith(label, i): return label.startswith(word[i:]) # the word may end inside the label
+            i += len(label)
+            children = child.children
+        return True
+
+    def contains_many(self, words: list[str]) -> list[bool]:
+        results = [False] * len(words)
+        # children of the nodes on the path of the previous word, with the characters leading to them
+        stack = [(self.children, '')]
+        for w in sorted(range(len(words)), key=words.__getitem__):
+            word = words[w]
+            while not word.startswith(stack[-1][1]): stack.pop() # the root's empty prefix always matches
+            children, prefix = stack[-1]
+            i = len(prefix)
+            n = len(word)
+            while i < n:
+                child = children.get(word[i])
+                if child is None: break
+                label = child.label
+                if not word.startswith(label, i):
+                    results[w] = label.startswith(word[i:])
+                    break
+                i += len(label)
+                children = child.children
+                stack.append((children, word[:i]))
+            else: results[w] = True
+        return results
+
+    def delete(self, word: str) -> bool:
+        marked_children = None
+        marked_node = None # owner of `marked_children`, None for the root
+        char_to_delete = ''
+        node = None
+        children = self.children
+        i = 0
+        n = len(word)
+        while i < n:
+            character = word[i]
+            child = children.get(character)
+            if child is None: return False # only a contained word can be deleted
+            label = child.label
+            if not word.startswith(label, i):
+                if not label.startswith(word[i:]): return False
+                # The word ends inside the label, where every (compressed) node has exactly one child.
+                if marked_children is None:
+                    marked_children = children
+                    marked_node = node
+                    char_to_delete = character
+                break
+            if not child.has_max_children(1): # reset mark, if the child has more than one child
+                marked_children = None
+            elif marked_children is None: # set mark, if it has at most one child
+                marked_children = children
+                marked_node = node
+                char_to_delete = character
+            i += len(label)
+            node = child
+            children = child.children
+        if marked_children is None: return False # every node of the path is still needed
+        del marked_children[char_to_delete]
+        if marked_node is not None and len(marked_children) == 1:
+            # A node with a single child is merged with it to keep the trie compressed.
+            for child in marked_children.values():
+                marked_node.label += child.label
+                marked_node.children = child.children
+        return True
+
+    def insert(self, word: str) -> bool:
+        node = None
+        children = self.children
+        i = 0
+        n = len(word)
+        while i < n:
+            character = word[i]
+            child = children.get(character)
+            if child is None:
+                if node is not None and not children:
+                    # A leaf is extended instead of getting a single child.
+                    node.label += word[i:]
+                else:
+                    # The rest of the word becomes a single new leaf.
+                    # New children dictionaries can be initialized with an empty dictionary.
+                    children[character] = HashNode(word[i:], {})
+                return True
+            label = child.label
+            if not word.startswith(label, i):
+                # Find the first character where the word and the label differ.
+                k = 1
+                end = min(len(label), n - i)
+                while k < end and label[k] == word[i+k]: k += 1
+                if k == n - i: return False # the word ends inside the label, so it is already contained
+                # Split the label: The upper part gets the rest of the old label and the rest of the word as children.
+                child.label = label[k:]
+                new_child = HashNode(word[i+k:], {})
+                children[character] = HashNode(label[:k], {label[k]: child, word[i+k]: new_child})
+                return True
+            i += len(label)
+            node = child
+            children = child.children
+        return False # if the traversal is completed, the word is already contained
+
+    def freeze(self) -> CompiledTrie:
+        """
+        Compiles the current state of the trie into a read-only `CompiledTrie`.
+
+        Later changes to this trie are not reflected by the compiled one.
+        """
+        # Expand the labels into a trie over their UTF-8 bytes, whose nodes are numbered in BFS order.
+        # State 0 is the root.
+        transitions: list[dict[int, int]] = [{}]
+        queue: deque[tuple[int, dict[str, HashNode]]] = deque([(0, self.children)])
+        while queue:
+            parent, children = queue.popleft()
+            for child in children.values():
+                state = parent
+                for byte in child.label.encode('utf-8', 'surrogatepass'):
+                    next_state = transitions[state].get(byte)
+                    if next_state is None:
+                        next_state = len(transitions)
+                        transitions.append({})
+                        transitions[state][byte] = next_state
+                    state = next_state
+                queue.append((state, child.children))
+
+        # Only bytes that occur in the trie get a column, all others are mapped to column 0, which no transition uses.
+        byte_to_col = bytearray(256)
+        occurring = sorted({byte for row in transitions for byte in row})
+        for col, byte in enumerate(occurring, 1): byte_to_col[byte] = col
+        width = len(occurring) + 1
+
+        # Most rows of the transition table hold a single transition, so the rows are packed into each other's gaps:
+        # each state gets the first offset at which all of its columns hit free slots (first fit).
+        # The free slots are kept in a sorted list, so that the search skips the densely packed front.
+        # Only the first few free slots are tried, the holes left behind are filled by the many single transitions.
+        # The slot of a child is then its position, and the root stays at position 0, which is never a child's slot.
+        base = array('i', [0]) * width
+        check = array('i', [-1]) * width
+        free = list(range(1, width)) # sorted free slots
+        position = [0] * len(transitions)
+        for state, row in enumerate(transitions):
+            if not row: continue # leaves keep offset 0, no slot can have them as parent
+            cols = sorted(byte_to_col[byte] for byte in row)
+            # The offset must not be negative. Behind the end of the arrays, every slot is free.
+            offset = len(check) - cols[0]
+            start = bisect_left(free, cols[0])
+            for slot in free[start:start+FREEZE_CANDIDATES]:
+                if all(check[slot - cols[0] + col] == -1 for col in cols[1:] if slot - cols[0] + col < len(check)):
+                    offset = slot - cols[0]
+                    break
+            if len(check) < offset + width: # every column of every position has to be a valid slot
+                free.extend(range(len(check), offset + width))
+                base.extend(array('i', [0]) * (offset + width - len(base)))
+                check.extend(array('i', [-1]) * (offset + width - len(check)))
+            base[position[state]] = offset
+            for byte, next_state in row.items():
+                slot = offset + byte_to_col[byte]
+                check[slot] = position[state]
+                position[next_state] = slot
+                del free[bisect_left(free, slot)]
+        return CompiledTrie(base=base, check=check, byte_to_col=bytes(byte_to_col))
 
     @staticmethod
-    def create_trie(words: list[str]) -> HashTrie:
+    def create_trie(words: list[str], is_sorted: bool = False) -> HashTrie:
         trie = HashTrie({})
+        if not is_sorted: words = sorted(words) # consecutive words share prefixes, so their nodes are still in cache
         for word in words: trie.insert(word)
-        return trie
\ No newline at end of file
+        return trie
+
+    @staticmethod
+    def create_trie_bulk(words: list[str]) -> HashTrie:
+        """
+        Creates the trie without inserting the words one by one.
+
+        Works like `VarSizeTrie.create_trie_bulk`: the sorted words are partitioned by their character
+        at the current depth (see `_label_partitions`) and each partition is built into its own subtrie.
+        The partitions still to be built are kept on a stack.
+        This way every node is created exactly once and no dictionary lookup is necessary.
+        """
+        words = sorted(words)
+        trie = HashTrie({})
+        stack: list[tuple[dict[str, HashNode], int, int, int]] = [(trie.children, 0, len(words), 0)]
+        while stack:
+            children, lo, hi, depth = stack.pop()
+            for character, label, start, end in _label_partitions(words, lo, hi, depth):
+                child = HashNode(label, {})
+                if start < end: stack.append((child.children, start, end, depth + len(label)))
+                children[character] = child
+        return trie
+
+
+
+@dataclass(slots=True)
+class CompiledTrie:
+    """
+    Class for read-only tries compiled from a `HashTrie` (see `HashTrie.freeze`).
+
+    The trie is stored as a DFA over the UTF-8 bytes of the words, whose sparse transition table
+    is packed into two flat arrays (double array): the transition of the state at position `p`
+    for column `c` leads to the position `base[p] + c`, if `check[base[p] + c] == p`.
+    The column of a byte is given by the byte to column mapping.
+    As every prefix of a path is contained, each state accepts.
+    Like a `HashTrie`, it accepts any `str`: lone surrogates are encoded with the `surrogatepass` error handler.
+    """
+
+    base: array # flat int32 table, per position the offset of the state's transitions
+    check: array # flat int32 table, per position the position of its parent state, -1 meaning empty
+    byte_to_col: bytes # translation table for `bytes.translate`, 0 for bytes that do not occur in the trie
+
+    def contains(self, word: str) -> bool:
+        """
+        Checks whether the trie contains the given word.
+
+        Returns `True` if the word is found, `False` otherwise.
+        """
+        base = self.base
+        check = self.check
+        state = 0
+        # Translating the whole word to columns happens in C, the loop only does integer arithmetic.
+        for col in word.encode('utf-8', 'surrogatepass').translate(self.byte_to_col):
+            slot = base[state] + col
+            if check[slot] != state: return False
+            state = slot
+        return True
@@ -155,23 +155,29 @@ class VarSizeTrie(AbstractTrie):
         return trie
     
     def print_trie(self):
-        self.__recursive_print()
-
-    def __recursive_print(self, is_root=True, depth=0, is_last=False, was_last=False):
-        prefix = "   "
-        for _ in range(depth-2):
-            prefix += "│  "
-        if depth > 1: prefix += "│  " if not was_last else "   "
-        prefix += "├──" if not is_last else "└──"
-
-        if is_root:
-            print(self.char)
-        else:
-            char = self.char if self.char != "\0" else "$"
-            print(prefix + char)
+        """
+        Prints the trie depth first. The nodes still to be printed are kept on a stack instead of recursing,
+        so that long words do not exceed the recursion limit.
+        """
+        stack = [(self, True, 0, False, False)]
+        while stack:
+            node, is_root, depth, is_last, was_last = stack.pop()
+            prefix = "   "
+            for _ in range(depth-2):
+                prefix += "│  "
+            if depth > 1: prefix += "│  " if not was_last else "   "
+            prefix += "├──" if not is_last else "└──"
+
+            if is_root:
+                print(node.char)
+            else:
+                char = node.char if node.char != "\0" else "$"
+                print(prefix + char)
 
-        for child in self.children:
-            child.__recursive_print(False, depth+1, id(child) == id(self.children[-1]), is_last)
+            # push the children in reverse, so that the first child is printed first
+            last_child = node.children[-1] if node.children else None
+            for child in reversed(node.children):
+                stack.append((child, False, depth+1, child is last_child, is_last))
 
 
 
@@ -252,25 +258,31 @@ class FixedSizeTrie(AbstractTrie):
         return trie
     
     def print_trie(self):
-        self.__recursive_print()
-    
-    def __recursive_print(self, name="root", is_root=True, depth=0):
-        prefix = "   "
-        for _ in range(depth-2):
-            prefix += "│  "
-        if depth > 1: prefix += "│  "
-        prefix += "└──"
-
-        if is_root:
-            print(name)
-        else:
-            char = name if name != "\0" else "$"
-            print(prefix + char)
+        """
+        Prints the trie depth first. The nodes still to be printed are kept on a stack instead of recursing,
+        so that long words do not exceed the recursion limit.
+        """
+        stack = [(self, "root", True, 0)]
+        while stack:
+            node, name, is_root, depth = stack.pop()
+            prefix = "   "
+            for _ in range(depth-2):
+                prefix += "│  "
+            if depth > 1: prefix += "│  "
+            prefix += "└──"
+
+            if is_root:
+                print(name)
+            else:
+                char = name if name != "\0" else "$"
+                print(prefix + char)
 
-        if self.children:
-            for i, child in enumerate(self.children):
-                if child:
-                    child.__recursive_print(self.alphabet[i], False, depth+1)
+            if node.children:
+                # push the children in reverse, so that the first child is printed first
+                for i in reversed(range(len(node.children))):
+                    child = node.children[i]
+                    if child:
+                        stack.append((child, node.alphabet[i], False, depth+1))
 
 
 
@@ -334,20 +346,27 @@ class HashTrie(AbstractTrie):
         return trie
     
     def print_trie(self):
-        self.__recursive_print()
-    
-    def __recursive_print(self, char="", is_root=True, depth=0, is_last=False, was_last=False):
-        prefix = "   "
-        for _ in range(depth-2):
-            prefix += "│  "
-        if depth > 1: prefix += "│  " if not was_last else "   "
-        prefix += "├──" if not is_last else "└──"
-
-        if is_root:
-            print("root")
-        else:
-            char = char if char != "\0" else "$"
-            print(prefix + char)
-
-        for child in self.children:
-            self.children[child].__recursive_print(child, False, depth+1, id(child) == id(list(self.children.keys())[-1]), is_last)
\ No newline at end of file
+        """
+        Prints the trie depth first. The nodes still to be printed are kept on a stack instead of recursing,
+        so that long words do not exceed the recursion limit.
+        """
+        stack = [(self, "", True, 0, False, False)]
+        while stack:
+            node, char, is_root, depth, is_last, was_last = stack.pop()
+            prefix = "   "
+            for _ in range(depth-2):
+                prefix += "│  "
+            if depth > 1: prefix += "│  " if not was_last else "   "
+            prefix += "├──" if not is_last else "└──"
+
+            if is_root:
+                print("root")
+            else:
+                char = char if char != "\0" else "$"
+                print(prefix + char)
+
+            # the last key is looked up once per node, not once per child
+            last_key = next(reversed(node.children), None)
+            # push the children in reverse, so that the first child is printed first
+            for child in reversed(node.children):
+                stack.append((node.children[child], child, False, depth+1, child == last_key, is_last))
\ No newline at end of file
@@ -0,0 +1,25 @@
+import random
+
+from iterative_tries import HashTrie
+
+# ASCII, the terminator, multi-byte UTF-8, the last code point and lone surrogates
+CHARACTERS = 'ab\0é日😀\U0010ffff\ud800\udc80'
+
+def random_word(rng: random.Random) -> str:
+    return ''.join(rng.choice(CHARACTERS) for _ in range(rng.randint(0, 6)))
+
+def test_freeze_matches_hash_trie():
+    """
+    The compiled trie has to answer every query like the hash trie it was frozen from.
+    """
+    rng = random.Random(0)
+    for _ in range(300):
+        words = [random_word(rng) for _ in range(rng.randint(0, 20))]
+        trie = HashTrie.create_trie(words)
+        compiled = trie.freeze()
+        queries = words + [word[:-1] for word in words] + [random_word(rng) for _ in range(50)]
+        assert [compiled.contains(query) for query in queries] == [trie.contains(query) for query in queries]
+
+if __name__ == '__main__':
+    test_freeze_matches_hash_trie()
+    print("freeze check passed")
@@ -7,9 +7,6 @@ import time
 import tracemalloc
 import argparse
 
-import sys
-sys.setrecursionlimit(10**6)
-
 ALPHABET = '\0' + string.ascii_letters + string.digits
 
 def create_trie(words: list[str], trie_type='fixed_size'):
@@ -17,16 +14,16 @@ def create_trie(words: list[str], trie_type='fixed_size'):
     This method creates a trie from a list of words and returns the trie and the time [ms] taken to create the trie.
     """
     if trie_type == 'variable_size': # variable size trie
-        trie_constructor = lambda w : VarSizeTrie.create_trie(w)
+        trie_constructor = lambda w : VarSizeTrie.create_trie_bulk(w)
     elif trie_type == 'fixed_size': # fixed size trie
-        trie_constructor = lambda w : FixedSizeTrie.create_trie(ALPHABET, w)
+        trie_constructor = lambda w : FixedSizeTrie.create_trie_bulk(ALPHABET, w)
     elif trie_type == 'hash': # hash trie
-        trie_constructor = lambda w : HashTrie.create_trie(w)
+        trie_constructor = lambda w : HashTrie.create_trie_bulk(w)
     else:
         raise ValueError("Invalid trie type")
-    start = time.time()
+    start = time.perf_counter()
     trie = trie_constructor(words)
-    end = time.time()
+    end = time.perf_counter()
     return trie, (end-start)*1e3
 
 def apply_query(trie: AbstractTrie, query: str):
@@ -70,28 +67,32 @@ if __name__ == "__main__":
     with open(input_file_path, 'r') as text_file:
         words = text_file.read().split('\n')
 
-        # measure memory usage of trie creation with tracemalloc
-        tracemalloc.start()
+        # measure timing of trie creation without tracemalloc, whose allocation hook slows down the construction
         trie, construction_time = create_trie(words, variant)
+
+        # measure memory usage of trie creation with tracemalloc on a second trie, which is discarded afterward
+        tracemalloc.start()
+        memory_trie, _ = create_trie(words, variant)
         current, peak = tracemalloc.get_traced_memory() # in bytes
+        tracemalloc.stop()
+        del memory_trie
 
     with open(query_file_path, 'r') as text_file:
         query_file = text_file.read().split('\n')
         results = []
 
         # measure timing of queries
-        q_start = time.time()
+        q_start = time.perf_counter()
         for query in query_file if query_file[-1] != '' else query_file[:-1]:
             result = apply_query(trie, query)
             results.append(result)
-        q_end = time.time() # in s
+        q_end = time.perf_counter() # in s
         query_time = (q_end-q_start)*1e3 # in ms
     
     # write results to output file
     name = "result_" + Path(input_file_path).stem + ".txt"
     full_path = Path(input_file_path).parent / name
     with open(full_path, 'w') as output_file:
-        for result in results:
-            output_file.write(str(result).lower() + '\n')
+        output_file.write(''.join(['true\n' if result else 'false\n' for result in results])) # a single write call
 
     print(f"name=KevinDanielKuryshev trie_variant={variant} trie_construction_time={construction_time} trie_construction_memory={peak/(1024*1024)} query_time={query_time}")
\ No newline at end of file